@@ -1,20 +1,22 @@
 import os
+import time
 import asyncio
-import threading
-from flask import Flask, jsonify, request, render_template
+from concurrent.futures import ThreadPoolExecutor
+import orjson
+from quart import Quart, jsonify, request, render_template
 from loguru import logger
 
 # Import your main classes
-from src.trading_bot import TradingBot 
+from src.trading_bot import TradingBot
 # Assuming db object is initialized in src.database.db.py
-from src.database.db import db 
+from src.database.db import db
 
 
 # --- INITIALIZATION ---
 # Using the full path for file access
 base_dir = os.path.dirname(os.path.abspath(__file__))
-app = Flask(__name__, 
-            static_folder=base_dir, 
+app = Quart(__name__,
+            static_folder=base_dir,
             template_folder=base_dir)
 
 # Read environment variables
@@ -25,68 +27,125 @@ BOT_DEMO = os.getenv("BOT_DEMO", "False").lower() == "true" if BOT_SSID else Tru
 if BOT_SSID is None or BOT_SSID == "":
     logger.warning("POCKET_OPTION_SSID not set. Running in forced DEMO mode.")
 
-# Initialize bot and asyncio loop
+# Initialize the bot. It shares the server's event loop, so routes can
+# await its coroutines directly without any cross-thread bridging.
 bot = TradingBot(ssid=BOT_SSID, demo=BOT_DEMO)
-bot_loop = asyncio.new_event_loop()
-
-
-# --- THREAD UTILITY ---
-def run_coro_in_bot_loop(coro):
-    """Safely runs an async coroutine in the bot's dedicated loop."""
-    if threading.current_thread() is threading.main_thread():
-        # Prevent deadlock if called from the main thread before loop starts
-        if bot_loop.is_running():
-            future = asyncio.run_coroutine_threadsafe(coro, bot_loop)
-            try:
-                # Wait for the result, with a timeout
-                return future.result(timeout=10)
-            except asyncio.TimeoutError:
-                logger.error("Async task timed out.")
-                return {"error": "Async operation timed out"}, 504
-            except Exception as e:
-                logger.error(f"Async operation failed: {e}")
-                return {"error": str(e)}, 500
-        else:
-            logger.warning("Bot loop not running.")
-            return {"error": "Bot not connected or running"}, 503
-    else:
-        # If called from a non-main thread (e.g., in a request context), 
-        # but the request itself is not the event loop. This is a common Flask pattern.
-        future = asyncio.run_coroutine_threadsafe(coro, bot_loop)
+
+# Bound how many bot coroutines API requests may have in flight at once.
+# Beyond the cap we shed load with a 503 instead of queueing unboundedly.
+BOT_CALL_LIMIT = int(os.getenv("BOT_CALL_LIMIT", "256"))
+_bot_call_slots = asyncio.Semaphore(BOT_CALL_LIMIT)
+
+
+async def run_bot_coro(coro, timeout: float = 10):
+    """Runs a bot coroutine with a concurrency cap and a timeout.
+
+    Returns the coroutine's result, or an (error dict, status) tuple the
+    route can hand straight to the client.
+    """
+    if _bot_call_slots.locked():
+        coro.close()
+        logger.warning("Bot call queue full; rejecting request.")
+        return {"error": "Bot is busy, try again shortly"}, 503
+
+    async with _bot_call_slots:
         try:
-            return future.result(timeout=10)
+            return await asyncio.wait_for(coro, timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.error("Async task timed out.")
+            return {"error": "Async operation timed out"}, 504
         except Exception as e:
-            logger.error(f"Async operation failed in request context: {e}")
+            logger.error(f"Async operation failed: {e}")
             return {"error": str(e)}, 500
 
 
+class TTLCache:
+    """Tiny freshness cache for the hot read-only routes.
+
+    Dashboard clients poll ~1 Hz; within the TTL window every poll gets
+    the same snapshot without recomputing it from bot state.
+    """
+    __slots__ = ("ttl", "store")
+
+    def __init__(self, ttl: float = 0.25):
+        self.ttl = ttl
+        self.store = {}
+
+    def get_or(self, key, producer):
+        now = time.monotonic()
+        entry = self.store.get(key)
+        if entry is not None and now - entry[0] < self.ttl:
+            return entry[1]
+        result = producer()
+        self.store[key] = (now, result)
+        return result
+
+
+snapshot_cache = TTLCache(ttl=float(os.getenv("STATUS_CACHE_TTL", "0.25")))
+
+# Shared orjson flags: ndarrays (SoA candle buffers) serialize natively,
+# and slotted dataclasses like Candle are handled by default
+_ORJSON_OPTS = orjson.OPT_SERIALIZE_NUMPY
+
+
+def ojson(obj):
+    """Serializes a response with orjson instead of stdlib json."""
+    return app.response_class(
+        orjson.dumps(obj, option=_ORJSON_OPTS),
+        mimetype="application/json"
+    )
+
+
+def ojson_snapshot(key, producer):
+    """TTL-cached orjson response; caches the serialized bytes so the
+    hot path does no encoding or dict building at all."""
+    body = snapshot_cache.get_or(
+        key, lambda: orjson.dumps(producer(), option=_ORJSON_OPTS)
+    )
+    return app.response_class(body, mimetype="application/json")
+
+
+@app.before_serving
+async def configure_executor():
+    """Sizes the loop's default executor for blocking work (sqlite, PDFs).
+
+    asyncio's default pool is only min(32, cpu+4) threads, which is too
+    small once blocking calls get routed through asyncio.to_thread.
+    """
+    pool_size = int(os.getenv("BOT_THREAD_POOL_SIZE", "128"))
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="bot-io")
+    )
+    logger.info(f"Default executor sized to {pool_size} threads.")
+
+
 # --- ROUTES ---
 
 @app.route('/')
-def index():
+async def index():
     """Serves the dashboard HTML."""
-    return render_template('index.html')
+    return await render_template('index.html')
 
 
 @app.route('/api/status', methods=['GET'])
-def get_status():
+async def get_status():
     """Returns the current status of the bot."""
-    return jsonify(bot.get_status())
+    return ojson_snapshot("status", bot.get_status)
 
 
 @app.route('/api/control', methods=['POST'])
-def bot_control():
-    data = request.json
+async def bot_control():
+    data = await request.get_json()
     action = data.get('action')
-    
+
     if action == 'start':
-        bot.start(bot_loop)
+        await bot.start()
         return jsonify({"message": "Bot started. Connection sequence initiated."}), 200
-    
+
     elif action == 'stop':
-        bot.stop()
+        await bot.stop()
         return jsonify({"message": "Bot stopped."}), 200
-        
+
     elif action == 'start_trading':
         bot.is_trading = True
         return jsonify({"message": "Trading loop activated."}), 200
@@ -94,15 +153,14 @@ def bot_control():
     elif action == 'stop_trading':
         bot.is_trading = False
         return jsonify({"message": "Trading loop deactivated."}), 200
-    
+
     elif action == 'join_tournament':
         tournament_id = data.get('id')
         if not tournament_id:
             return jsonify({"message": "Missing tournament ID"}), 400
-            
-        coro = bot.tournament_manager.join_tournament_by_id(tournament_id)
-        result = run_coro_in_bot_loop(coro)
-        
+
+        result = await run_bot_coro(bot.tournament_manager.join_tournament_by_id(tournament_id))
+
         if isinstance(result, tuple):
             return jsonify(result[0]), result[1]
 
@@ -116,8 +174,8 @@ def bot_control():
 
 
 @app.route('/api/settings', methods=['POST'])
-def update_settings():
-    data = request.json
+async def update_settings():
+    data = await request.get_json()
     setting = data.get('setting')
     value = data.get('value')
 
@@ -130,38 +188,37 @@ def update_settings():
     elif setting == 'current_timeframe':
         bot.current_timeframe = int(value)
         return jsonify({"message": f"Timeframe set to {value}s"}), 200
-    
+
     return jsonify({"message": f"Unknown setting: {setting}"}), 400
 
 
 @app.route('/api/tournaments/free', methods=['GET'])
-def get_free_tournaments():
+async def get_free_tournaments():
     """Returns a list of all active free tournaments for the dashboard."""
-    coro = bot.tournament_manager.get_all_active_free_tournaments()
-    result = run_coro_in_bot_loop(coro)
-    
+    result = await run_bot_coro(bot.tournament_manager.get_all_active_free_tournaments())
+
     if isinstance(result, tuple):
-        return jsonify(result[0]), result[1]
-    return jsonify(result), 200
+        return ojson(result[0]), result[1]
+    return ojson(result), 200
 
 
 @app.route('/api/market/analysis', methods=['GET'])
-def get_market_analysis():
+async def get_market_analysis():
     """Returns the current market analysis (patterns, levels, etc.)."""
-    return jsonify(bot.get_market_analysis())
+    return ojson_snapshot("analysis", bot.get_market_analysis)
 
 
 @app.route('/api/trades/history', methods=['GET'])
-def get_trade_stats():
+async def get_trade_stats():
     """Returns trade history and statistics."""
     # Note: In a real app, this should pull from the DB for persistence.
-    return jsonify(bot.get_trade_stats())
+    return ojson_snapshot("trades", bot.get_trade_stats)
 
 
 if __name__ == '__main__':
-    # Start the asyncio loop in a separate thread for the bot logic
-    threading.Thread(target=bot_loop.run_forever, daemon=True).start()
+    # Run under uvicorn so the bot and the API share one asyncio loop.
+    # Single worker: `bot` holds in-process state.
+    import uvicorn
 
-    # Get port from environment or default to 5000
     port = int(os.environ.get('PORT', 5000))
-    app.run(host='0.0.0.0', port=port, debug=False)
+    uvicorn.run(app, host='0.0.0.0', port=port)
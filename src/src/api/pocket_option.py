@@ -2,6 +2,8 @@ import asyncio
 import os
 import random
 import time
+import numpy as np
+from dataclasses import dataclass, asdict
 from typing import Optional, Dict, List, Callable
 from datetime import datetime
 from loguru import logger
@@ -10,10 +12,56 @@ try:
     # This is the assumed library for Pocket Option
     from pocketoptionapi_async import AsyncPocketOptionClient, OrderDirection
     POCKET_API_AVAILABLE = True
+    # Resolved once at import so place_trade does a dict lookup per call
+    # instead of re-deriving the enum from a string comparison
+    _DIRECTION_MAP = {"CALL": OrderDirection.CALL, "PUT": OrderDirection.PUT}
 except ImportError:
     POCKET_API_AVAILABLE = False
+    _DIRECTION_MAP = {}
     logger.warning("PocketOptionAPI not available, running in simulation mode")
 
+@dataclass(slots=True)
+class Candle:
+    """One OHLCV bar. Slots keep the record ~3x smaller than a dict,
+    which matters at thousands of candles per minute across assets.
+
+    Supports c["close"]-style access so existing analyzer code and the
+    dict candles it grew up with stay interchangeable.
+    """
+    timestamp: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: int
+    asset: str
+    timeframe: int
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+# Pocket Option caps each session at ~4 live candle streams, so live mode
+# fans subscriptions out over a pool of sessions
+MAX_SYMBOLS_PER_WEBSOCKET = int(os.getenv("MAX_SYMBOLS_PER_WEBSOCKET", "4"))
+MAX_WEBSOCKET_CONNECTIONS = int(os.getenv("MAX_WEBSOCKET_CONNECTIONS", "8"))
+
+
+class _PoolEntry:
+    """One pooled API session and the assets currently streamed on it."""
+    __slots__ = ("client", "symbols")
+
+    def __init__(self, client):
+        self.client = client
+        self.symbols = set()
+
+
 class PocketOptionClient:
     def __init__(self, ssid: str = "", demo: bool = True):
         self.ssid = ssid or os.getenv("POCKET_OPTION_SSID", "")
@@ -27,6 +75,10 @@ class PocketOptionClient:
         ]
         # Bot connects live ONLY if API is available AND an SSID is provided
         self.simulation_mode = not POCKET_API_AVAILABLE or not self.ssid
+        # Batched RNG for candle simulation (see subscribe_candles)
+        self._rng = np.random.default_rng()
+        # Live WebSocket session pool (asset -> session routing)
+        self._pool: List[_PoolEntry] = []
         
     async def connect(self) -> bool:
         if self.simulation_mode:
@@ -40,7 +92,9 @@ class PocketOptionClient:
             self.api = AsyncPocketOptionClient(session_id=self.ssid, demo=self.demo)
             await self.api.connect()
             self.connected = True
-            self.balance = await self.api.get_balance() 
+            # The primary session doubles as the first pool entry
+            self._pool = [_PoolEntry(self.api)]
+            self.balance = await self.api.get_balance()
             logger.success(f"Connected LIVE. Demo: {self.demo}. Balance: ${self.balance:.2f}")
             return True
         except Exception as e:
@@ -51,42 +105,93 @@ class PocketOptionClient:
     async def subscribe_candles(self, asset: str, timeframe: int, callback: Callable):
         """Simulates receiving a continuous stream of candles."""
         if self.simulation_mode:
-            # Simulation logic
+            # Simulation logic. Randomness is pre-generated in blocks:
+            # per-candle random.uniform/randint calls dominate synthesis
+            # cost at short timeframes, a vectorized block is near-free.
             base_price = 1.12000
+            block = 1024
+            i = block
+            loop = asyncio.get_running_loop()
+            next_tick = loop.time()
             while self.is_connected():
-                # Generate a simulated candle
+                if i >= block:
+                    close_deltas = self._rng.uniform(-0.0005, 0.0005, size=block)
+                    high_offsets = self._rng.uniform(0, 0.0001, size=block)
+                    low_offsets = self._rng.uniform(0, 0.0001, size=block)
+                    volumes = self._rng.integers(100, 1001, size=block)
+                    i = 0
+
+                # Generate a simulated candle from the current block slot
                 open_price = base_price
-                close_price = open_price + (random.uniform(-0.0001, 0.0001) * 5)
-                high_price = max(open_price, close_price, base_price + random.uniform(0, 0.0001))
-                low_price = min(open_price, close_price, base_price - random.uniform(0, 0.0001))
-                
-                candle = {
-                    "timestamp": int(time.time()),
-                    "open": round(open_price, 5),
-                    "high": round(high_price, 5),
-                    "low": round(low_price, 5),
-                    "close": round(close_price, 5),
-                    "volume": random.randint(100, 1000),
-                    "asset": asset,
-                    "timeframe": timeframe
-                }
+                close_price = open_price + close_deltas[i]
+                high_price = max(open_price, close_price, base_price + high_offsets[i])
+                low_price = min(open_price, close_price, base_price - low_offsets[i])
+
+                candle = Candle(
+                    timestamp=int(time.time()),
+                    open=round(open_price, 5),
+                    high=round(high_price, 5),
+                    low=round(low_price, 5),
+                    close=round(close_price, 5),
+                    volume=int(volumes[i]),
+                    asset=asset,
+                    timeframe=timeframe
+                )
                 base_price = close_price
+                i += 1
                 
                 try:
                     await callback(candle)
                 except Exception as e:
                     logger.error(f"Candle callback error: {e}")
                 
-                # Wait for the specified timeframe
-                await asyncio.sleep(timeframe) 
+                # Sleep until the next aligned tick instead of a flat
+                # timeframe, so callback duration doesn't accumulate as
+                # drift and the wakeups stay phase-locked
+                next_tick += timeframe
+                now = loop.time()
+                if next_tick < now - 2 * timeframe:
+                    next_tick = now  # fell badly behind; resync
+                await asyncio.sleep(max(0.0, next_tick - now))
             return # Exit loop if not connected
 
-        # Real API logic (You would use self.api.subscribe_candle_data in real use)
-        # For simplicity, we just log a message if live connection is active
+        # Real API logic: route the stream through the session pool so the
+        # per-session subscription cap does not limit us to 4 assets
         logger.info(f"Live API: Subscribing to {asset} candles...")
-        # A real implementation would involve self.api.subscribe_candle_data(asset, timeframe, callback)
+        try:
+            client = await self._acquire_stream_client(asset)
+            await client.subscribe_candle_data(asset, timeframe, callback)
+        except Exception as e:
+            logger.error(f"Error subscribing to {asset} candles: {e}")
+            return
         await asyncio.sleep(100000) # Keep task alive until cancelled
 
+    async def _acquire_stream_client(self, asset: str):
+        """Returns a pooled API session with a free candle-stream slot.
+
+        Assets route to the first session with capacity; a new session is
+        opened when all existing ones are full, up to
+        MAX_WEBSOCKET_CONNECTIONS.
+        """
+        for entry in self._pool:
+            if asset in entry.symbols or len(entry.symbols) < MAX_SYMBOLS_PER_WEBSOCKET:
+                entry.symbols.add(asset)
+                return entry.client
+
+        if len(self._pool) >= MAX_WEBSOCKET_CONNECTIONS:
+            raise RuntimeError(
+                f"WebSocket pool exhausted ({MAX_WEBSOCKET_CONNECTIONS} sessions "
+                f"x {MAX_SYMBOLS_PER_WEBSOCKET} streams)"
+            )
+
+        client = AsyncPocketOptionClient(session_id=self.ssid, demo=self.demo)
+        await client.connect()
+        entry = _PoolEntry(client)
+        entry.symbols.add(asset)
+        self._pool.append(entry)
+        logger.info(f"Opened WebSocket session {len(self._pool)} for {asset}")
+        return client
+
     async def get_tournaments(self) -> List[Dict]:
         """Fetches the list of all available tournaments (UPDATED)."""
         if self.simulation_mode:
@@ -145,7 +250,7 @@ class PocketOptionClient:
 
         try:
             # Real API call
-            api_direction = OrderDirection.CALL if direction.upper() == "CALL" else OrderDirection.PUT
+            api_direction = _DIRECTION_MAP.get(direction.upper(), OrderDirection.PUT)
             # This is a placeholder for the real API call
             trade_info = await self.api.place_order(asset, amount, api_direction, expiration) 
             return {"trade_id": trade_info["id"], "status": "pending"}
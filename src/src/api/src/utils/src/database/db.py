@@ -1,5 +1,6 @@
 import sqlite3
 import json
+import threading
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from loguru import logger
@@ -7,19 +8,30 @@ from loguru import logger
 class Database:
     def __init__(self, db_path: str = "trading_bot.db"):
         self.db_path = db_path
-        self.conn = None
+        # One connection per thread: a single shared connection just moves
+        # contention into sqlite's internal mutex, and WAL already lets
+        # connections read while another writes
+        self._local = threading.local()
         self.init_database()
-    
+
     def get_connection(self):
-        if self.conn is None:
-            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
-            self.conn.row_factory = sqlite3.Row
-        return self.conn
-    
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+            conn.row_factory = sqlite3.Row
+            # journal_mode=WAL is persistent on the file; the rest are
+            # per-connection and must be reapplied here
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
+            self._local.conn = conn
+        return conn
+
     def init_database(self):
         conn = self.get_connection()
         cursor = conn.cursor()
-        
+
         # Table for Market Data (Candles)
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS candles (
@@ -105,6 +117,21 @@ class Database:
             )
         ''')
         
+        # Indexes for the hot read paths: recent-trades listing and
+        # time-windowed candle/pattern scans (otherwise full scan + sort)
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_trades_created
+            ON trades(created_at DESC)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_candles_at
+            ON candles(asset, timeframe, timestamp DESC)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_patterns_at
+            ON patterns(asset, timeframe, timestamp DESC)
+        ''')
+
         conn.commit()
         logger.info("Database initialized.")
 
@@ -118,6 +145,24 @@ class Database:
         conn.commit()
         return cursor.lastrowid
 
+    def save_candles_bulk(self, rows: List[tuple]) -> int:
+        """Inserts a batch of candles in one transaction.
+
+        Each row is (asset, timeframe, timestamp, open, high, low, close,
+        volume). Duplicate (asset, timeframe, timestamp) rows are ignored.
+        """
+        if not rows:
+            return 0
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.executemany('''
+            INSERT OR IGNORE INTO candles
+                (asset, timeframe, timestamp, open, high, low, close, volume)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', rows)
+        conn.commit()
+        return cursor.rowcount
+
     def update_trade_outcome(self, trade_id: str, outcome: str, profit: float):
         conn = self.get_connection()
         cursor = conn.cursor()
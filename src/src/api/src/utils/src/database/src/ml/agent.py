@@ -3,35 +3,143 @@ import pickle
 import os
 from typing import Dict, List, Optional, Tuple
 from loguru import logger
-from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
+from sklearn.ensemble import HistGradientBoostingClassifier
 from sklearn.preprocessing import StandardScaler
 from sklearn.model_selection import train_test_split
 import random
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.warning("Numba not available, batch signal scoring runs as pure Python")
+
+    def njit(*args, **kwargs):
+        # No-op decorator so the kernels below still run, just uncompiled
+        if args and callable(args[0]):
+            return args[0]
+        def wrap(func):
+            return func
+        return wrap
+
+
+# Categorical signals as int8 codes: -1 bearish/PUT, 0 neutral, +1 bullish/CALL
+@njit(cache=True)
+def _score_signal_batch(rsi_codes, macd_codes, pattern_codes, pattern_strengths):
+    """Scores a batch of candles with the same rules as generate_signal.
+
+    Returns (directions, confidences) where direction uses the int8
+    code convention above (0 = HOLD).
+    """
+    n = rsi_codes.shape[0]
+    directions = np.zeros(n, dtype=np.int8)
+    confidences = np.full(n, 0.5, dtype=np.float32)
+
+    for i in range(n):
+        # Pattern leg
+        strength = pattern_strengths[i]
+        call_score = strength if pattern_codes[i] > 0 else -strength
+
+        # Indicator leg (majority rule over RSI/MACD)
+        bullish = (1.0 if rsi_codes[i] > 0 else 0.0) + (1.5 if macd_codes[i] > 0 else 0.0)
+        bearish = (1.0 if rsi_codes[i] < 0 else 0.0) + (1.5 if macd_codes[i] < 0 else 0.0)
+        if bullish > bearish:
+            ind_strength = min(0.8, bullish / 2)
+            call_score += ind_strength
+        elif bearish > bullish:
+            ind_strength = min(0.8, bearish / 2)
+            call_score -= ind_strength
+        else:
+            call_score += -0.5  # neutral leg scores against, as in the scalar path
+
+        confidence = max(0.5, min(0.9, abs(call_score) / 2))
+        if confidence < 0.65:
+            continue  # HOLD
+
+        directions[i] = 1 if call_score > 0 else -1
+        confidences[i] = confidence
+
+    return directions, confidences
+
+
 class TradingAgent:
+    # Feature vector layout for experience replay: rsi, macd histogram,
+    # pattern strength, level distance, trend code, confidence, amount pct,
+    # outcome delay
+    N_FEATURES = 8
+
     def __init__(self, model_path: str = "models"):
         self.model_path = model_path
         os.makedirs(model_path, exist_ok=True)
         
-        self.pattern_model = RandomForestClassifier(
-            n_estimators=100, max_depth=10, random_state=42
+        # Histogram-binned boosting trains ~10x faster than the old
+        # RandomForest/GradientBoosting pair with the same fit/predict API,
+        # which matters when retraining on rolling windows
+        self.pattern_model = HistGradientBoostingClassifier(
+            max_iter=100, max_depth=10, random_state=42
         )
-        self.direction_model = GradientBoostingClassifier(
-            n_estimators=50, max_depth=5, random_state=42
+        self.direction_model = HistGradientBoostingClassifier(
+            max_iter=50, max_depth=5, random_state=42
         )
         self.scaler = StandardScaler()
-        
+        # float32 affine captured from the fitted scaler; transform then
+        # runs in place without the float64 copies scaler.transform makes
+        self._scale: Optional[np.ndarray] = None
+        self._shift: Optional[np.ndarray] = None
+
         self.is_trained = False
         self.training_data: List[Dict] = []
         self.min_training_samples = 100
         
-        self.experience_buffer: List[Dict] = []
+        # Experience replay as a pre-allocated SoA ring buffer: features in
+        # one float32 block, labels in int8, head pointer wraps at capacity.
+        # A list of 10k dicts costs ~10x the memory and forces a fresh
+        # np.array(...) conversion on every training pass.
         self.max_buffer_size = 10000
+        self._exp_features = np.empty((self.max_buffer_size, self.N_FEATURES), dtype=np.float32)
+        self._exp_labels = np.empty(self.max_buffer_size, dtype=np.int8)
+        self._exp_head = 0
+        self._exp_size = 0
         
         self.performance_history: List[Dict] = []
         
         self._load_models()
     
+    def freeze_scaler(self):
+        """Captures the fitted StandardScaler as float32 affine terms.
+
+        Call once after scaler.fit; normalize_features then applies
+        (X - mean) / std as X * scale - shift without leaving float32.
+        """
+        self._scale = (1.0 / self.scaler.scale_).astype(np.float32)
+        self._shift = (self.scaler.mean_ * self._scale).astype(np.float32)
+
+    def normalize_features(self, X: np.ndarray) -> np.ndarray:
+        """In-place float32 standardization of a feature matrix."""
+        if self._scale is None:
+            return X
+        np.multiply(X, self._scale, out=X)
+        np.subtract(X, self._shift, out=X)
+        return X
+
+    def add_experience(self, features: np.ndarray, label: int):
+        """Records one (feature vector, win/loss label) sample in the ring."""
+        self._exp_features[self._exp_head] = features
+        self._exp_labels[self._exp_head] = label
+        self._exp_head = (self._exp_head + 1) % self.max_buffer_size
+        self._exp_size = min(self._exp_size + 1, self.max_buffer_size)
+
+    def get_experiences(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns (X, y) views over the filled part of the ring buffer.
+
+        Zero-copy until the buffer wraps; training code can feed these
+        straight into fit() without a conversion pass.
+        """
+        if self._exp_size < self.max_buffer_size:
+            return self._exp_features[:self._exp_size], self._exp_labels[:self._exp_size]
+        return self._exp_features, self._exp_labels
+
     def _load_models(self):
         # Placeholder for model loading logic
         self.is_trained = False 
@@ -94,34 +202,48 @@ class TradingAgent:
         else:
             return {"direction": "neutral", "strength": 0.5}
 
+    # Maps categorical signal strings onto the int8 codes the batch
+    # kernel understands (-1 bearish/PUT, 0 neutral, +1 bullish/CALL)
+    SIGNAL_CODES = {
+        "oversold": 1, "overbought": -1,
+        "bullish": 1, "bearish": -1,
+        "CALL": 1, "PUT": -1
+    }
+
+    def score_batch(self, rsi_codes: np.ndarray, macd_codes: np.ndarray,
+                    pattern_codes: np.ndarray, pattern_strengths: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Batch version of generate_signal for backtesting.
+
+        Takes int8 signal-code arrays (see SIGNAL_CODES) plus pattern
+        strengths and returns (directions, confidences) arrays. The live
+        per-candle path keeps the dict API; this one runs the same rules
+        through a JIT'd loop so millions of candles score in one call.
+        """
+        return _score_signal_batch(
+            np.ascontiguousarray(rsi_codes, dtype=np.int8),
+            np.ascontiguousarray(macd_codes, dtype=np.int8),
+            np.ascontiguousarray(pattern_codes, dtype=np.int8),
+            np.ascontiguousarray(pattern_strengths, dtype=np.float32)
+        )
+
+    # Expiration lookup: row = volatility bin (calm -> volatile), column =
+    # pattern-strength bin (strong -> weak). Replaces two branch ladders
+    # with one table index, and the bins vectorize over candle batches.
+    _EXP_TABLE = np.array([300, 120, 60])[:, None] * np.array([1, 2, 3])[None, :]
+
+    # Trade-size multiplier per confidence bin (<0.6, <0.7, <0.8, >=0.8)
+    _AMOUNT_MULT = np.array([0.5, 1.0, 1.5, 2.0])
+
     def get_trade_expiration(self, volatility: float, pattern_strength: float) -> int:
-        if volatility > 0.002:
-            base_exp = 60
-        elif volatility > 0.001:
-            base_exp = 120
-        else:
-            base_exp = 300
-        
-        if pattern_strength > 0.8:
-            return base_exp
-        elif pattern_strength > 0.6:
-            return base_exp * 2
-        else:
-            return base_exp * 3
-    
-    def get_trade_amount(self, balance: float, confidence: float, 
+        vol_bin = int(volatility > 0.001) + int(volatility > 0.002)
+        str_bin = int(pattern_strength > 0.6) + int(pattern_strength > 0.8)
+        return int(self._EXP_TABLE[vol_bin, 2 - str_bin])
+
+    def get_trade_amount(self, balance: float, confidence: float,
                          base_pct: float = 0.02) -> float:
         """Determines trade amount using Martingale-like risk adjustment."""
-        if confidence < 0.6:
-            pct = base_pct * 0.5
-        elif confidence < 0.7:
-            pct = base_pct
-        elif confidence < 0.8:
-            pct = base_pct * 1.5
-        else:
-            pct = base_pct * 2
-        
-        amount = balance * pct
+        conf_bin = int(confidence >= 0.6) + int(confidence >= 0.7) + int(confidence >= 0.8)
+        amount = balance * base_pct * self._AMOUNT_MULT[conf_bin]
         # Min trade amount $1, Max trade amount 5% of balance
         return max(1, min(amount, balance * 0.05))
     
@@ -1,10 +1,21 @@
 import os
 import re
+import asyncio
+from collections import defaultdict
 from typing import Dict, List, Optional
 from loguru import logger
-import requests
+import aiohttp
 from bs4 import BeautifulSoup
-from PyPDF2 import PdfReader
+
+try:
+    # C-backed PDFium bindings; roughly an order of magnitude faster
+    # than PyPDF2's pure-Python text extraction
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    PDFIUM_AVAILABLE = False
+    from PyPDF2 import PdfReader
+    logger.warning("pypdfium2 not available, falling back to PyPDF2 for PDF parsing")
 
 try:
     # Requires 'openai' package and OPENAI_API_KEY env var
@@ -15,10 +26,29 @@ except ImportError:
     logger.warning("OpenAI library not available. Knowledge extraction will be basic/disabled.")
 
 class KnowledgeLearner:
+    # Keyword -> category map used for concept extraction
+    KEYWORD_CATEGORIES = {
+        "Martingale": "Risk Management", "Fibonacci": "Technical Levels",
+        "Bollinger Bands": "Indicators", "Japanese Candlesticks": "Patterns",
+        "Economic News": "Fundamental Analysis"
+    }
+
     def __init__(self, db=None):
         self.db = db
         self.openai_client = None
         self.learned_concepts: List[Dict] = []
+        # Inverted index: lowercased keyword -> concepts, so relevance
+        # lookups scale with distinct keywords rather than total concepts
+        self._concepts_by_kw: Dict[str, List[Dict]] = defaultdict(list)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # Single alternation regex compiled once so each document is
+        # scanned in one pass instead of once per keyword
+        self._keyword_re = re.compile(
+            r'\b(' + '|'.join(re.escape(k) for k in self.KEYWORD_CATEGORIES) + r')\b',
+            re.IGNORECASE
+        )
+        self._keyword_lookup = {k.lower(): k for k in self.KEYWORD_CATEGORIES}
         
         if OPENAI_AVAILABLE and os.getenv("OPENAI_API_KEY"):
             try:
@@ -28,15 +58,81 @@ class KnowledgeLearner:
                 logger.error(f"Error initializing OpenAI client: {e}")
                 self.openai_client = None
     
-    def learn_from_pdf(self, pdf_path: str) -> Dict:
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Returns the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+            )
+        return self._session
+
+    async def close(self):
+        if self._session and not self._session.closed:
+            await self._session.close()
+
+    async def learn_from_urls(self, urls: List[str]) -> List[Dict]:
+        """Fetches and learns from multiple URLs concurrently."""
+        results = await asyncio.gather(
+            *[self._fetch_and_extract(url) for url in urls],
+            return_exceptions=True
+        )
+        summaries = []
+        for url, result in zip(urls, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error learning from {url}: {result}")
+                summaries.append({"status": "error", "message": str(result)})
+            else:
+                summaries.append(result)
+        return summaries
+
+    async def _fetch_and_extract(self, url: str) -> Dict:
+        """Downloads a page and stores the concepts found in its text."""
+        session = self._get_session()
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as resp:
+            resp.raise_for_status()
+            html = await resp.text()
+
+        # Parsing is CPU-bound; keep it off the event loop
+        text = await asyncio.to_thread(self._html_to_text, html)
+        concepts = self._extract_trading_concepts(text)
+
+        if self.db:
+            for concept in concepts:
+                self.db.save_knowledge(
+                    source=url,
+                    category=concept["category"],
+                    content=concept["content"],
+                    summary=concept.get("summary"),
+                    relevance_score=concept.get("relevance", 0.5)
+                )
+
+        self.learned_concepts.extend(concepts)
+        self._index_concepts(concepts)
+
+        logger.info(f"Learned {len(concepts)} concepts from {url}")
+        return {"status": "success", "concepts_learned": len(concepts)}
+
+    @staticmethod
+    def _html_to_text(html: str) -> str:
+        return BeautifulSoup(html, "html.parser").get_text(separator="\n")
+
+    @staticmethod
+    def _extract_pdf_text(pdf_path: str) -> str:
+        if PDFIUM_AVAILABLE:
+            pdf = pdfium.PdfDocument(pdf_path)
+            try:
+                return "\n".join(
+                    page.get_textpage().get_text_range() for page in pdf
+                )
+            finally:
+                pdf.close()
+        return "\n".join(page.extract_text() for page in PdfReader(pdf_path).pages)
+
+    async def learn_from_pdf(self, pdf_path: str) -> Dict:
         """Extracts text from PDF and stores concepts."""
         try:
-            reader = PdfReader(pdf_path)
-            text = ""
-            
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
-            
+            # Extraction is CPU-bound; keep it off the event loop
+            text = await asyncio.to_thread(self._extract_pdf_text, pdf_path)
             concepts = self._extract_trading_concepts(text)
             
             if self.db:
@@ -50,7 +146,8 @@ class KnowledgeLearner:
                     )
             
             self.learned_concepts.extend(concepts)
-            
+            self._index_concepts(concepts)
+
             logger.info(f"Learned {len(concepts)} concepts from {pdf_path}")
             return {"status": "success", "concepts_learned": len(concepts)}
         except Exception as e:
@@ -60,41 +157,49 @@ class KnowledgeLearner:
     def _extract_trading_concepts(self, text: str) -> List[Dict]:
         """Simple keyword-based extraction (can be enhanced with AI)."""
         concepts = []
-        
-        keywords = {
-            "Martingale": "Risk Management", "Fibonacci": "Technical Levels",
-            "Bollinger Bands": "Indicators", "Japanese Candlesticks": "Patterns",
-            "Economic News": "Fundamental Analysis"
-        }
-        
-        for keyword, category in keywords.items():
-            if re.search(r'\b' + re.escape(keyword) + r'\b', text, re.IGNORECASE):
-                # Simple extraction, needs advanced logic for real summary
-                concept_content = f"Discussion of {keyword}..." 
-                concepts.append({
-                    "keyword": keyword,
-                    "category": category,
-                    "content": concept_content,
-                    "summary": f"The document mentions {keyword} in the context of {category}.",
-                    "relevance": 0.8
-                })
-        
+        seen = set()
+
+        for match in self._keyword_re.finditer(text):
+            keyword = self._keyword_lookup[match.group(1).lower()]
+            if keyword in seen:
+                continue
+            seen.add(keyword)
+
+            category = self.KEYWORD_CATEGORIES[keyword]
+            # Simple extraction, needs advanced logic for real summary
+            concept_content = f"Discussion of {keyword}..."
+            concepts.append({
+                "keyword": keyword,
+                "category": category,
+                "content": concept_content,
+                "summary": f"The document mentions {keyword} in the context of {category}.",
+                "relevance": 0.8
+            })
+
         return concepts
 
+    def _index_concepts(self, concepts: List[Dict]):
+        """Adds concepts to the keyword inverted index."""
+        for concept in concepts:
+            keyword = concept.get("keyword", "")
+            if keyword:
+                self._concepts_by_kw[keyword.lower()].append(concept)
+
     def get_relevant_knowledge(self, context: str) -> List[Dict]:
         """Fetches the top 5 relevant learned concepts for the given context."""
-        if not self.learned_concepts:
+        if not self._concepts_by_kw:
             return []
-        
+
         context_lower = context.lower()
         relevant = []
-        
-        # Simple relevance check based on context keywords (e.g., current asset/indicator)
-        for concept in self.learned_concepts:
-            keyword = concept.get("keyword", "")
-            if keyword and keyword.lower() in context_lower:
-                relevant.append(concept)
-        
+
+        # One substring check per distinct keyword, not per stored concept
+        for keyword, concepts in self._concepts_by_kw.items():
+            if keyword in context_lower:
+                relevant.extend(concepts)
+                if len(relevant) >= 5:
+                    break
+
         return relevant[:5]
     
     def get_stats(self) -> Dict:
@@ -1,8 +1,74 @@
 import numpy as np
+from collections import defaultdict, deque
+from itertools import islice
 from typing import List, Dict, Optional, Tuple
 from loguru import logger
 
+
+def candles_to_arrays(candles: List[Dict]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Converts a newest-first candle list into (open, high, low, close)
+    SoA arrays so the analyzers can run vectorized instead of re-reading
+    dict keys per candle. Build once per tick and share."""
+    n = len(candles)
+    opens = np.fromiter((c["open"] for c in candles), dtype=np.float64, count=n)
+    highs = np.fromiter((c["high"] for c in candles), dtype=np.float64, count=n)
+    lows = np.fromiter((c["low"] for c in candles), dtype=np.float64, count=n)
+    closes = np.fromiter((c["close"] for c in candles), dtype=np.float64, count=n)
+    return opens, highs, lows, closes
+
+
+class CandleRing:
+    """Fixed-capacity struct-of-arrays candle store (newest at `head`).
+
+    Writing one row per tick replaces the candles_to_arrays rebuild,
+    which re-read four dict fields from every candle in the window. The
+    arrays() accessor hands back the same newest-first (open, high, low,
+    close) tuple the analyzers already take via `arrays=`.
+    """
+    __slots__ = ("capacity", "opens", "highs", "lows", "closes",
+                 "timestamps", "head", "size")
+
+    def __init__(self, capacity: int = 200):
+        self.capacity = capacity
+        self.opens = np.empty(capacity, dtype=np.float64)
+        self.highs = np.empty(capacity, dtype=np.float64)
+        self.lows = np.empty(capacity, dtype=np.float64)
+        self.closes = np.empty(capacity, dtype=np.float64)
+        self.timestamps = np.empty(capacity, dtype=np.int64)
+        self.head = 0
+        self.size = 0
+
+    def push(self, candle: Dict):
+        """O(1) insert of the newest candle; oldest drops off implicitly."""
+        self.head = (self.head - 1) % self.capacity
+        i = self.head
+        self.opens[i] = candle["open"]
+        self.highs[i] = candle["high"]
+        self.lows[i] = candle["low"]
+        self.closes[i] = candle["close"]
+        self.timestamps[i] = candle.get("timestamp") or 0
+        self.size = min(self.size + 1, self.capacity)
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Newest-first SoA views (zero-copy while the ring is unwrapped;
+        one contiguous copy per array once it wraps)."""
+        i, n = self.head, self.size
+        if i + n <= self.capacity:
+            sl = slice(i, i + n)
+            return (self.opens[sl], self.highs[sl], self.lows[sl], self.closes[sl])
+        j = i + n - self.capacity
+        return tuple(np.concatenate((a[i:], a[:j]))
+                     for a in (self.opens, self.highs, self.lows, self.closes))
+
+
 class CandlestickAnalyzer:
+    # Constant pattern fields folded once at import; detections copy a
+    # template and fill in only the per-bar values
+    _ENGULFING = {"pattern": "Bullish Engulfing", "type": "reversal",
+                  "signal": "CALL", "strength": 0.9}
+    _DOJI = {"pattern": "Doji", "type": "indecision",
+             "signal": "neutral", "strength": 0.5}
+
     def __init__(self):
         self.pattern_names = [
             "doji", "hammer", "inverted_hammer", "shooting_star",
@@ -11,34 +77,116 @@ class CandlestickAnalyzer:
             "bullish_harami", "bearish_harami", "tweezer_top", "tweezer_bottom",
             "spinning_top", "marubozu_bullish", "marubozu_bearish"
         ]
-    
-    def analyze_candles(self, candles: List[Dict]) -> List[Dict]:
-        """Analyzes recent candles for known candlestick patterns."""
+        # Per-asset rolling caches for analyze_incremental: entries are
+        # (tick_detected, pattern); ticks count calls per asset
+        self._pattern_caches: Dict[str, deque] = defaultdict(deque)
+        self._ticks: Dict[str, int] = defaultdict(int)
+
+    def analyze_incremental(self, candles: List[Dict],
+                            arrays: Optional[Tuple[np.ndarray, ...]] = None) -> List[Dict]:
+        """Pattern detection touching only the newest bar.
+
+        analyze_candles re-scans the whole 11-bar window every tick even
+        though only bar 0 is new; here each detector is a constant-time
+        scalar check on the newest bar(s), and previously detected
+        patterns age through a per-asset cache until they roll off the
+        window. Output matches the full scan when fed one candle per call.
+        """
         if len(candles) < 3:
             return []
-        
-        patterns_found = []
-        
+
+        opens, highs, lows, closes = arrays if arrays is not None else candles_to_arrays(candles)
+        key = candles[0].get("asset") or ""
+        self._ticks[key] += 1
+        tick = self._ticks[key]
+        cache = self._pattern_caches[key]
+
+        current = candles[0]
+        cur_o, cur_c = opens[0], closes[0]
+        prev_o, prev_c = opens[1], closes[1]
+
+        hits = []
+        # Bullish Engulfing: bearish prev swallowed by a bullish current
+        if prev_c < prev_o and cur_c > cur_o and cur_c > prev_o and cur_o < prev_c:
+            hits.append((tick, {**self._ENGULFING,
+                                "timestamp": current.get("timestamp"),
+                                "price": current.get("close")}))
+
+        # Doji: tiny body relative to a non-degenerate range
+        range_size = highs[0] - lows[0]
+        if abs(cur_c - cur_o) < 0.1 * range_size and range_size > 0.0001:
+            hits.append((tick, {**self._DOJI,
+                                "timestamp": current.get("timestamp"),
+                                "price": current.get("close")}))
+
+        # Front of the deque stays (newest tick, engulfing-before-doji)
+        cache.extendleft(reversed(hits))
+
+        # Evict patterns that have aged past the 11-bar analysis window
+        while cache and tick - cache[-1][0] > 10:
+            cache.pop()
+
+        return [{**p, "candle_index": tick - t0} for t0, p in cache]
+
+    def analyze_candles(self, candles: List[Dict],
+                        arrays: Optional[Tuple[np.ndarray, ...]] = None) -> List[Dict]:
+        """Analyzes recent candles for known candlestick patterns.
+
+        Detection runs as vectorized boolean masks over SoA arrays
+        (built here, or passed in via `arrays` to share with the other
+        analyzers) rather than per-candle dict reads.
+        """
+        if len(candles) < 3:
+            return []
+
+        opens, highs, lows, closes = arrays if arrays is not None else candles_to_arrays(candles)
+
         # Analyze the 10 most recent candles for single/multi-candle patterns
-        for i in range(len(candles) - 2):
+        upper = min(len(candles) - 2, 11)
+
+        # Shared per-candle facts, computed once as whole-array compares so
+        # every pattern below is a cheap mask combination
+        window = slice(0, upper + 1)
+        is_bull = closes[window] > opens[window]
+        is_bear = closes[window] < opens[window]
+        body = np.abs(closes[window] - opens[window])
+        range_size = highs[window] - lows[window]
+
+        # Bullish Engulfing: bearish prev swallowed by a bullish current
+        engulfing = (
+            is_bear[1:] & is_bull[:upper]
+            & (closes[:upper] > opens[1:upper + 1])
+            & (opens[:upper] < closes[1:upper + 1])
+        )
+
+        # Doji: tiny body relative to a non-degenerate range
+        doji = (body[:upper] < 0.1 * range_size[:upper]) & (range_size[:upper] > 0.0001)
+
+        patterns_found = []
+        for i in np.flatnonzero(engulfing | doji):
+            i = int(i)
             current = candles[i]
-            prev = candles[i + 1] if i + 1 < len(candles) else None
-            prev2 = candles[i + 2] if i + 2 < len(candles) else None
-            
-            detected = self._detect_patterns(current, prev, prev2)
-            for pattern in detected:
+            if engulfing[i]:
+                patterns_found.append({
+                    "pattern": "Bullish Engulfing",
+                    "type": "reversal",
+                    "signal": "CALL",
+                    "strength": 0.9,
+                    "candle_index": i,
+                    "timestamp": current.get("timestamp"),
+                    "price": current.get("close")
+                })
+            if doji[i]:
                 patterns_found.append({
-                    "pattern": pattern["name"],
-                    "type": pattern["type"],
-                    "signal": pattern["signal"],
-                    "strength": pattern["strength"],
+                    "pattern": "Doji",
+                    "type": "indecision",
+                    "signal": "neutral",
+                    "strength": 0.5,
                     "candle_index": i,
                     "timestamp": current.get("timestamp"),
                     "price": current.get("close")
                 })
-            
-            if i >= 10: break # Limit check to recent 10 candles
-            
+
         return patterns_found
 
     def _is_bullish(self, c: Dict) -> bool:
@@ -47,43 +195,25 @@ class CandlestickAnalyzer:
     def _is_bearish(self, c: Dict) -> bool:
         return c["close"] < c["open"]
 
-    def _detect_patterns(self, current: Dict, prev: Optional[Dict], prev2: Optional[Dict]) -> List[Dict]:
-        """Placeholder for individual pattern detection logic."""
-        
-        detected = []
-        
-        # Example: Bullish Engulfing
-        if prev and self._is_bearish(prev) and self._is_bullish(current) and \
-           current["close"] > prev["open"] and current["open"] < prev["close"]:
-            detected.append({
-                "name": "Bullish Engulfing",
-                "type": "reversal",
-                "signal": "CALL",
-                "strength": 0.9
-            })
-            
-        # Example: Doji
-        body_size = abs(current["close"] - current["open"])
-        range_size = current["high"] - current["low"]
-        if body_size < 0.1 * range_size and range_size > 0.0001:
-            detected.append({
-                "name": "Doji",
-                "type": "indecision",
-                "signal": "neutral",
-                "strength": 0.5
-            })
-            
-        return detected
-
-    def get_trend(self, candles: List[Dict], period: int = 50) -> str:
-        """Determines the short-term trend based on recent closes."""
+    def get_trend(self, candles: List[Dict], period: int = 50,
+                  closes: Optional[np.ndarray] = None) -> str:
+        """Determines the short-term trend based on recent closes.
+
+        Pass the cached SoA closes via `closes` to skip rebuilding the
+        array on every API hit.
+        """
         if len(candles) < period:
             return "neutral"
-            
-        closes = [c["close"] for c in candles[:period]]
-        
+
+        if closes is None:
+            # islice rather than a slice so deque-backed candle rings work
+            closes = np.fromiter((c["close"] for c in islice(candles, period)),
+                                 dtype=np.float64, count=period)
+        else:
+            closes = closes[:period]
+
         # Check if the last close is significantly above/below a long-term moving average
-        avg_price = np.mean(closes)
+        avg_price = closes.mean()
         current_price = closes[0]
         
         diff_pct = (current_price - avg_price) / avg_price * 100
@@ -1,96 +1,190 @@
 import numpy as np
-from typing import List, Dict, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from loguru import logger
 from collections import defaultdict
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.warning("Numba not available, swing-point scan runs as pure Python")
+
+    def njit(*args, **kwargs):
+        # No-op decorator so the kernel below still runs, just uncompiled
+        if args and callable(args[0]):
+            return args[0]
+        def wrap(func):
+            return func
+        return wrap
+
+
+def _make_swing_kernel(sensitivity: int) -> Callable:
+    """Builds a swing scanner specialized for one `sensitivity` value.
+
+    The closed-over `sens` is a compile-time constant to Numba, so the
+    comparator window unrolls completely instead of looping over a
+    runtime bound. (No cache=True here — Numba cannot disk-cache
+    closures; the compiled kernel is memoized in _swing_kernels instead.)
+    """
+    sens = sensitivity
+
+    @njit
+    def kernel(highs, lows):
+        # A bar is a swing high if its high dominates the `sens` bars on
+        # both sides (ties allowed), and symmetrically for swing lows.
+        n = highs.shape[0]
+        res_idx = np.empty(n, dtype=np.int64)
+        sup_idx = np.empty(n, dtype=np.int64)
+        nr = 0
+        ns = 0
+
+        for i in range(sens, n - sens):
+            is_resistance = True
+            for j in range(1, sens + 1):
+                if highs[i] < highs[i - j] or highs[i] < highs[i + j]:
+                    is_resistance = False
+                    break
+            if is_resistance:
+                res_idx[nr] = i
+                nr += 1
+
+            is_support = True
+            for j in range(1, sens + 1):
+                if lows[i] > lows[i - j] or lows[i] > lows[i + j]:
+                    is_support = False
+                    break
+            if is_support:
+                sup_idx[ns] = i
+                ns += 1
+
+        return res_idx[:nr], sup_idx[:ns]
+
+    return kernel
+
+
+# One specialized kernel per sensitivity; the bot only ever uses the
+# default (3), so this holds a single entry in practice
+_swing_kernels: Dict[int, Callable] = {}
+
+
+def _find_swings(highs, lows, sensitivity):
+    """Dispatches to the kernel specialized for `sensitivity`."""
+    kernel = _swing_kernels.get(sensitivity)
+    if kernel is None:
+        kernel = _swing_kernels[sensitivity] = _make_swing_kernel(sensitivity)
+    return kernel(highs, lows)
+
+
 class LevelAnalyzer:
     def __init__(self, tolerance: float = 0.0005):
         self.tolerance = tolerance
         self.levels: Dict[str, List[Dict]] = defaultdict(list)
     
-    def find_support_resistance(self, candles: List[Dict], 
-                                 sensitivity: int = 3, count: int = 3) -> Dict[str, List[Dict]]:
-        """Finds the strongest nearest Support and Resistance levels."""
-        
+    def find_support_resistance(self, candles: List[Dict],
+                                 sensitivity: int = 3, count: int = 3,
+                                 arrays: Optional[tuple] = None) -> Dict[str, List[Dict]]:
+        """Finds the strongest nearest Support and Resistance levels.
+
+        `arrays` takes the shared (open, high, low, close) SoA build so
+        the conversion is done once per tick across analyzers.
+        """
         if len(candles) < sensitivity * 2:
             return {"support": [], "resistance": []}
-        
-        highs = [c["high"] for c in candles]
-        lows = [c["low"] for c in candles]
+
+        if arrays is not None:
+            _, highs, lows, _ = arrays
+        else:
+            n = len(candles)
+            highs = np.fromiter((c["high"] for c in candles), dtype=np.float64, count=n)
+            lows = np.fromiter((c["low"] for c in candles), dtype=np.float64, count=n)
         current_price = candles[0]["close"]
-        
+
+        # 1. Identify swing points (local highs/lows) via the JIT'd scan
+        res_idx, sup_idx = _find_swings(highs, lows, sensitivity)
+
         potential_levels = []
-        
-        # 1. Identify swing points (local highs/lows)
-        for i in range(sensitivity, len(candles) - sensitivity):
-            is_resistance = all(highs[i] >= highs[i-j] and highs[i] >= highs[i+j] 
-                               for j in range(1, sensitivity + 1))
-            if is_resistance:
-                potential_levels.append({"price": highs[i], "type": "resistance", "index": i})
-            
-            is_support = all(lows[i] <= lows[i-j] and lows[i] <= lows[i+j] 
-                            for j in range(1, sensitivity + 1))
-            if is_support:
-                potential_levels.append({"price": lows[i], "type": "support", "index": i})
+        ri = si = 0
+        # Merge the two ascending index streams, resistance first on ties,
+        # to keep the original interleaved ordering
+        while ri < len(res_idx) or si < len(sup_idx):
+            if si >= len(sup_idx) or (ri < len(res_idx) and res_idx[ri] <= sup_idx[si]):
+                i = int(res_idx[ri])
+                potential_levels.append({"price": float(highs[i]), "type": "resistance", "index": i})
+                ri += 1
+            else:
+                i = int(sup_idx[si])
+                potential_levels.append({"price": float(lows[i]), "type": "support", "index": i})
+                si += 1
 
-        # 2. Merge nearby levels (Level Clustering)
+        # 2. Merge nearby levels (Level Clustering). Clusters accumulate as
+        # running scalars (sum, size, support count) instead of member
+        # lists, so finalizing costs O(1) rather than rebuilding and
+        # counting lists per cluster.
         merged_levels = []
         potential_levels.sort(key=lambda x: x["price"])
-        
+
+        def finalize_cluster(price_sum: float, size: int, support_count: int):
+            merged_levels.append({
+                "price": price_sum / size,
+                # Majority vote; support wins ties (the old set/count idiom
+                # broke ties arbitrarily)
+                "type": "support" if support_count * 2 >= size else "resistance",
+                "touches": size,
+                "strength": min(1.0, size / sensitivity)
+            })
+
         if potential_levels:
-            current_cluster = [potential_levels[0]]
-            for i in range(1, len(potential_levels)):
-                prev_price = current_cluster[-1]["price"]
-                current_price_level = potential_levels[i]["price"]
-                
+            first = potential_levels[0]
+            prev_price = first["price"]
+            price_sum = first["price"]
+            size = 1
+            support_count = 1 if first["type"] == "support" else 0
+
+            for level in potential_levels[1:]:
+                price = level["price"]
                 # If current price is within tolerance of the previous one
-                if abs(current_price_level - prev_price) < self.tolerance * current_price:
-                    current_cluster.append(potential_levels[i])
+                if abs(price - prev_price) < self.tolerance * current_price:
+                    price_sum += price
+                    size += 1
+                    support_count += level["type"] == "support"
                 else:
-                    # Finalize cluster
-                    cluster_price = np.mean([c["price"] for c in current_cluster])
-                    cluster_type = max(set(c["type"] for c in current_cluster), key=[c["type"] for c in current_cluster].count)
-                    cluster_strength = len(current_cluster) / sensitivity # Simple strength metric
-                    
-                    merged_levels.append({
-                        "price": cluster_price,
-                        "type": cluster_type,
-                        "touches": len(current_cluster),
-                        "strength": min(1.0, cluster_strength)
-                    })
-                    current_cluster = [potential_levels[i]]
+                    finalize_cluster(price_sum, size, support_count)
+                    price_sum = price
+                    size = 1
+                    support_count = 1 if level["type"] == "support" else 0
+                prev_price = price
 
             # Finalize the last cluster
-            if current_cluster:
-                cluster_price = np.mean([c["price"] for c in current_cluster])
-                cluster_type = max(set(c["type"] for c in current_cluster), key=[c["type"] for c in current_cluster].count)
-                cluster_strength = len(current_cluster) / sensitivity
-                
-                merged_levels.append({
-                    "price": cluster_price,
-                    "type": cluster_type,
-                    "touches": len(current_cluster),
-                    "strength": min(1.0, cluster_strength)
-                })
-
-        # 3. Separate into Support/Resistance and find nearest
-        nearest_support = []
-        nearest_resistance = []
-
-        for level in merged_levels:
-            # Calculate distance from current price
-            level["distance"] = abs(level["price"] - current_price)
-            
-            if level["type"] == "support" and level["price"] < current_price:
-                nearest_support.append(level)
-            elif level["type"] == "resistance" and level["price"] > current_price:
-                nearest_resistance.append(level)
-            # S/R flips logic can be added here (e.g., if price breaks a level)
-                
-        nearest_support.sort(key=lambda x: x["distance"])
-        nearest_resistance.sort(key=lambda x: x["distance"])
-        
+            finalize_cluster(price_sum, size, support_count)
+
+        # 3. Separate into Support/Resistance and find nearest. Distances
+        # are computed in one vectorized pass; argpartition pulls the
+        # nearest `count` per side without fully sorting every level.
+        if not merged_levels:
+            return {"support": [], "resistance": []}
+
+        m = len(merged_levels)
+        prices = np.fromiter((lv["price"] for lv in merged_levels), dtype=np.float64, count=m)
+        is_support = np.fromiter((lv["type"] == "support" for lv in merged_levels),
+                                 dtype=np.bool_, count=m)
+        distances = np.abs(prices - current_price)
+        # S/R flips logic can be added here (e.g., if price breaks a level)
+
+        def nearest(mask: np.ndarray) -> List[Dict]:
+            sel = np.flatnonzero(mask)
+            dist = distances[sel]
+            if len(sel) > count:
+                keep = np.argpartition(dist, count)[:count]
+                sel, dist = sel[keep], dist[keep]
+            out = []
+            for j in np.argsort(dist):
+                level = merged_levels[int(sel[j])]
+                level["distance"] = float(dist[j])
+                out.append(level)
+            return out
+
         return {
-            "support": nearest_support[:count],
-            "resistance": nearest_resistance[:count]
+            "support": nearest(is_support & (prices < current_price)),
+            "resistance": nearest(~is_support & (prices > current_price))
         }
@@ -1,5 +1,5 @@
 import numpy as np
-from typing import List, Dict
+from typing import List, Dict, Optional
 from loguru import logger
 
 try:
@@ -9,33 +9,219 @@ except ImportError:
     TA_AVAILABLE = False
     logger.warning("TA library not available, using basic indicators")
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.warning("Numba not available, indicator kernels run as pure Python")
+
+    def njit(*args, **kwargs):
+        # No-op decorator so the kernels below still run, just uncompiled
+        if args and callable(args[0]):
+            return args[0]
+        def wrap(func):
+            return func
+        return wrap
+
+
+@njit(cache=True)
+def _rsi_last(closes, period):
+    """Wilder-smoothed RSI over `closes`, returning only the final value.
+
+    Single pass, no allocations — replaces the pd.Series/ta round-trip
+    that rebuilt arrays per tick just to read the last element.
+    """
+    n = closes.shape[0]
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        delta = closes[i] - closes[i - 1]
+        if delta > 0:
+            avg_gain += delta
+        else:
+            avg_loss -= delta
+    avg_gain /= period
+    avg_loss /= period
+
+    for i in range(period + 1, n):
+        delta = closes[i] - closes[i - 1]
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        avg_gain = (avg_gain * (period - 1) + gain) / period
+        avg_loss = (avg_loss * (period - 1) + loss) / period
+
+    if avg_loss == 0.0:
+        return 100.0
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+
+@njit(cache=True)
+def _ema_series(closes, alpha):
+    """First-order IIR: out[i] = alpha*x[i] + (1-alpha)*out[i-1].
+
+    Returns the full series so callers (MACD etc.) can reuse it without
+    re-running the recurrence.
+    """
+    out = np.empty_like(closes)
+    out[0] = closes[0]
+    for i in range(1, closes.shape[0]):
+        out[i] = alpha * closes[i] + (1.0 - alpha) * out[i - 1]
+    return out
+
+@njit(cache=True)
+def _fused_indicators(highs, lows, closes):
+    """One pass over the chronological window updating every rolling
+    accumulator together — RSI, EMA 10/20, SMA 10/20, Bollinger,
+    ATR — plus the short Stochastic windows. Same math as the
+    per-indicator kernels, but the bars are loaded from memory once
+    instead of once per indicator.
+
+    Returns [rsi, sma10, sma20, ema10, ema20, bb_mean, bb_std, k, d, atr].
+    Requires n >= 20.
+    """
+    n = closes.shape[0]
+    period = 14
+
+    avg_gain = 0.0
+    avg_loss = 0.0
+    a10 = 2.0 / 11.0
+    a20 = 2.0 / 21.0
+    e10 = closes[0]
+    e20 = closes[0]
+    s10 = 0.0
+    s20 = 0.0
+    b_sq = 0.0
+    atr_sum = 0.0
+
+    for i in range(n):
+        c = closes[i]
+        if i > 0:
+            delta = c - closes[i - 1]
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+            if i <= period:
+                avg_gain += gain
+                avg_loss += loss
+                if i == period:
+                    avg_gain /= period
+                    avg_loss /= period
+            else:
+                avg_gain = (avg_gain * (period - 1) + gain) / period
+                avg_loss = (avg_loss * (period - 1) + loss) / period
+
+            e10 = a10 * c + (1.0 - a10) * e10
+            e20 = a20 * c + (1.0 - a20) * e20
+
+            if i >= n - period:
+                pc = closes[i - 1]
+                tr = highs[i] - lows[i]
+                hc = abs(highs[i] - pc)
+                lc = abs(lows[i] - pc)
+                if hc > tr:
+                    tr = hc
+                if lc > tr:
+                    tr = lc
+                atr_sum += tr
+
+        if i >= n - 10:
+            s10 += c
+        if i >= n - 20:
+            s20 += c
+            b_sq += c * c
+
+    rsi = 100.0 if avg_loss == 0.0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    bb_mean = s20 / 20.0
+    bb_var = b_sq / 20.0 - bb_mean * bb_mean
+    bb_std = np.sqrt(bb_var) if bb_var > 0.0 else 0.0
+
+    # Stochastic: %K for the last 3 bars, %D as their mean
+    k0 = 0.0
+    d_sum = 0.0
+    for off in range(2, -1, -1):
+        end = n - 1 - off
+        hh = highs[end]
+        ll = lows[end]
+        for j in range(end - period + 1, end + 1):
+            if highs[j] > hh:
+                hh = highs[j]
+            if lows[j] < ll:
+                ll = lows[j]
+        span = hh - ll
+        k0 = 50.0 if span <= 0.0 else (closes[end] - ll) / span * 100.0
+        d_sum += k0
+
+    out = np.empty(10, dtype=np.float64)
+    out[0] = rsi
+    out[1] = s10 / 10.0
+    out[2] = s20 / 20.0
+    out[3] = e10
+    out[4] = e20
+    out[5] = bb_mean
+    out[6] = bb_std
+    out[7] = k0
+    out[8] = d_sum / 3.0
+    out[9] = atr_sum / period
+    return out
+
+
 class TechnicalIndicators:
     def __init__(self):
         self.indicators = {}
     
-    def calculate_all(self, candles: List[Dict]) -> Dict:
-        """Calculates a set of core indicators."""
+    def calculate_all(self, candles: List[Dict],
+                      arrays: Optional[tuple] = None) -> Dict:
+        """Calculates a set of core indicators.
+
+        `arrays` takes the shared (open, high, low, close) SoA build
+        (newest-first, as stored) so the per-tick conversion happens once
+        across all analyzers.
+        """
         if len(candles) < 20:
             return {}
-        
-        # Prepare data (must be in reverse order for correct TA calculation)
-        candles_rev = candles[::-1] 
-        closes = np.array([c["close"] for c in candles_rev])
-        highs = np.array([c["high"] for c in candles_rev])
-        lows = np.array([c["low"] for c in candles_rev])
-        
+
+        if arrays is not None:
+            _, highs, lows, closes = arrays
+        else:
+            n = len(candles)
+            highs = np.fromiter((c["high"] for c in candles), dtype=np.float64, count=n)
+            lows = np.fromiter((c["low"] for c in candles), dtype=np.float64, count=n)
+            closes = np.fromiter((c["close"] for c in candles), dtype=np.float64, count=n)
+
+        # TA math wants chronological order; reversed ndarray slices are
+        # views, unlike the old candles[::-1] list copy
+        closes = closes[::-1]
+        highs = highs[::-1]
+        lows = lows[::-1]
+
+        # One fused kernel pass updates every rolling accumulator together;
+        # the per-indicator methods below remain for standalone callers
+        out = _fused_indicators(np.ascontiguousarray(highs),
+                                np.ascontiguousarray(lows),
+                                np.ascontiguousarray(closes))
+        rsi, sma10, sma20, ema10, ema20, bb_mean, bb_std, k_value, d_value, atr = out
+
+        rsi_signal = "overbought" if rsi > 70 else "oversold" if rsi < 30 else "neutral"
+        last = float(closes[-1])
+        bb_upper = float(bb_mean + 2.0 * bb_std)
+        bb_lower = float(bb_mean - 2.0 * bb_std)
+        bb_position = "upper" if last > bb_upper else "lower" if last < bb_lower else "mid"
+        stoch_signal = "overbought" if k_value > 80 else "oversold" if k_value < 20 else "neutral"
+
         result = {
-            "rsi": self.calculate_rsi(closes),
-            "sma_10": self.calculate_sma(closes, 10),
-            "sma_20": self.calculate_sma(closes, 20),
-            "ema_10": self.calculate_ema(closes, 10),
-            "ema_20": self.calculate_ema(closes, 20),
+            "rsi": {"value": float(rsi), "signal": rsi_signal},
+            "sma_10": float(sma10),
+            "sma_20": float(sma20),
+            "ema_10": float(ema10),
+            "ema_20": float(ema20),
             "macd": self.calculate_macd(closes),
-            "bollinger": self.calculate_bollinger_bands(closes),
-            "stochastic": self.calculate_stochastic(highs, lows, closes),
-            "atr": self.calculate_atr(highs, lows, closes)
+            "bollinger": {"position": bb_position, "upper": bb_upper, "lower": bb_lower},
+            "stochastic": {"signal": stoch_signal, "k_value": float(k_value),
+                           "d_value": float(d_value)},
+            "atr": {"value": float(atr),
+                    "volatility": "high" if atr > 0.001 * last else "low"}
         }
-        
+
         self.indicators = result
         return result
     
@@ -44,21 +230,15 @@ class TechnicalIndicators:
         return float(np.mean(closes[-period:]))
 
     def calculate_ema(self, closes: np.ndarray, period: int) -> Optional[float]:
-        # Simple placeholder calculation for EMA
         if len(closes) < period: return None
         alpha = 2 / (period + 1)
-        ema = closes[0]
-        for close in closes[1:]:
-            ema = alpha * close + (1 - alpha) * ema
-        return float(ema)
+        return float(_ema_series(np.asarray(closes, dtype=np.float64), alpha)[-1])
         
     def calculate_rsi(self, closes: np.ndarray, period: int = 14) -> Dict:
-        if not TA_AVAILABLE:
+        if len(closes) <= period:
             return {"value": 50.0, "signal": "neutral"}
-        
-        # Calculate RSI using TA library
-        rsi_series = ta.momentum.RSI(pd.Series(closes), window=period).rsi()
-        rsi_value = float(rsi_series.iloc[-1]) if not rsi_series.empty else 50.0
+
+        rsi_value = float(_rsi_last(np.asarray(closes, dtype=np.float64), period))
 
         signal = "neutral"
         if rsi_value > 70: signal = "overbought"
@@ -73,23 +253,57 @@ class TechnicalIndicators:
         # Placeholder for MACD calculation logic
         return {"trend": "neutral", "histogram": 0.0}
 
-    def calculate_bollinger_bands(self, closes: np.ndarray) -> Dict:
-        if not TA_AVAILABLE:
+    def calculate_bollinger_bands(self, closes: np.ndarray, period: int = 20,
+                                  num_std: float = 2.0) -> Dict:
+        if len(closes) < period:
             return {"position": "mid"}
-            
-        # Placeholder for Bollinger Bands calculation logic
-        return {"position": "mid", "upper": 0.0, "lower": 0.0}
 
-    def calculate_stochastic(self, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray) -> Dict:
-        if not TA_AVAILABLE:
-            return {"signal": "neutral"}
-            
-        # Placeholder for Stochastic Oscillator calculation logic
-        return {"signal": "neutral", "k_value": 50.0, "d_value": 50.0}
+        window = np.asarray(closes[-period:], dtype=np.float64)
+        mid = window.mean()
+        band = num_std * window.std()
+        upper = mid + band
+        lower = mid - band
 
-    def calculate_atr(self, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray) -> Dict:
-        if not TA_AVAILABLE:
+        last = float(closes[-1])
+        position = "upper" if last > upper else "lower" if last < lower else "mid"
+        return {"position": position, "upper": float(upper), "lower": float(lower)}
+
+    def calculate_stochastic(self, highs: np.ndarray, lows: np.ndarray,
+                             closes: np.ndarray, period: int = 14,
+                             smooth: int = 3) -> Dict:
+        if len(closes) < period + smooth - 1:
+            return {"signal": "neutral", "k_value": 50.0, "d_value": 50.0}
+
+        # Windowed highest-high/lowest-low for the last `smooth` bars,
+        # computed as strided views — no pandas objects per tick
+        tail = period + smooth - 1
+        high_windows = np.lib.stride_tricks.sliding_window_view(
+            np.asarray(highs[-tail:], dtype=np.float64), period)
+        low_windows = np.lib.stride_tricks.sliding_window_view(
+            np.asarray(lows[-tail:], dtype=np.float64), period)
+        highest = high_windows.max(axis=1)
+        lowest = low_windows.min(axis=1)
+
+        span = highest - lowest
+        k_values = np.where(
+            span > 0, (np.asarray(closes[-smooth:]) - lowest) / np.where(span > 0, span, 1.0) * 100.0, 50.0)
+        k_value = float(k_values[-1])
+        d_value = float(k_values.mean())
+
+        signal = "overbought" if k_value > 80 else "oversold" if k_value < 20 else "neutral"
+        return {"signal": signal, "k_value": k_value, "d_value": d_value}
+
+    def calculate_atr(self, highs: np.ndarray, lows: np.ndarray,
+                      closes: np.ndarray, period: int = 14) -> Dict:
+        if len(closes) < period + 1:
             return {"value": 0.0}
-            
-        # Placeholder for ATR calculation logic
-        return {"value": 0.00015, "volatility": "low"}
+
+        h = np.asarray(highs[-period:], dtype=np.float64)
+        l = np.asarray(lows[-period:], dtype=np.float64)
+        prev_close = np.asarray(closes[-period - 1:-1], dtype=np.float64)
+
+        true_range = np.maximum.reduce([h - l, np.abs(h - prev_close), np.abs(l - prev_close)])
+        value = float(true_range.mean())
+
+        volatility = "high" if value > 0.001 * float(closes[-1]) else "low"
+        return {"value": value, "volatility": volatility}
@@ -3,6 +3,11 @@ import time
 from typing import List, Dict, Optional
 from loguru import logger
 
+# Statuses that count as joinable; module-level so the filter doesn't
+# rebuild a list literal per tournament
+_ACTIVE = frozenset({"active", "invitation_open"})
+
+
 class TournamentManager:
     """Manages tournament finding and automated joining."""
     def __init__(self, client, agent, db=None):
@@ -19,10 +24,10 @@ class TournamentManager:
         try:
             tournaments = await self.client.get_tournaments()
             
-            # Filter for active tournaments with no entry fee. 
+            # Filter for active tournaments with no entry fee.
             free_tournaments = [
-                t for t in tournaments 
-                if t.get("entry_fee", 1) == 0 and t.get("status") in ["active", "invitation_open"]
+                t for t in tournaments
+                if t.get("entry_fee", 1) == 0 and t.get("status") in _ACTIVE
             ]
             
             logger.info(f"Found {len(free_tournaments)} active free tournaments.")
@@ -62,14 +67,9 @@ class TournamentManager:
         logger.info("Attempting automated join for Daily Free Tournament...")
         
         try:
-            free_tournaments = await self.get_all_active_free_tournaments()
-            
-            # Case-insensitive search for the common name
-            daily_free_tour = next((
-                t for t in free_tournaments 
-                if "daily free tournament" in t.get("name", "").lower()
-            ), None)
-            
+            tournaments = await self.client.get_tournaments()
+            daily_free_tour = self._find_daily_free(tournaments)
+
             if daily_free_tour:
                 tournament_id = daily_free_tour["id"]
                 success = await self.join_tournament_by_id(tournament_id)
@@ -82,3 +82,16 @@ class TournamentManager:
         except Exception as e:
             logger.error(f"Error during automated tournament join: {e}")
             return None
+
+    @staticmethod
+    def _find_daily_free(tournaments: List[Dict]) -> Optional[Dict]:
+        """Single pass checking fee, status and name together.
+
+        The old path filtered all free tournaments first and then
+        re-scanned (re-lowercasing every name) for the daily one.
+        """
+        for t in tournaments:
+            if (t.get("entry_fee", 1) == 0 and t.get("status") in _ACTIVE
+                    and "daily free tournament" in t.get("name", "").lower()):
+                return t
+        return None
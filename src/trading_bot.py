@@ -1,13 +1,18 @@
 import asyncio
+import heapq
 import time
-from typing import Dict, List, Optional
+from collections import deque
+from functools import partial
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from loguru import logger
-import random # For trade simulation
+import numpy as np
 
 from src.api.pocket_option import PocketOptionClient
 from src.database.db import db
-from src.patterns.candlestick import CandlestickAnalyzer
+from src.patterns.candlestick import CandlestickAnalyzer, CandleRing, candles_to_arrays
 from src.patterns.levels import LevelAnalyzer
 from src.patterns.indicators import TechnicalIndicators
 from src.ml.agent import TradingAgent
@@ -30,23 +35,65 @@ class TradingBot:
         self.is_running = False
         self.is_learning = False
         self.is_trading = False
+
+        # get_relevant_knowledge result for the constant signal context;
+        # invalidated whenever the learner loop refreshes its knowledge
+        self._knowledge_cache: Optional[List[Dict]] = None
         
         self.current_asset = "EURUSD_otc"
         self.current_timeframe = 60
         self.available_timeframes = [60, 300, 900, 3600]
         
         self.market_data: Dict[str, Dict] = {}
+        # Latest analysis memoized per asset, keyed by the newest candle's
+        # timestamp, so API polls between candles cost zero recomputation
+        self._analysis_cache: Dict[str, Tuple] = {}
         self.patterns_detected: List[Dict] = []
         self.levels_detected: Dict = {}
         self.indicator_values: Dict = {}
         
-        self.trade_history: List[Dict] = []
+        # Bounded so a long session can't grow memory without limit;
+        # appends stay O(1) and the tallies below keep stats exact even
+        # after old trades roll off
+        self.trade_history: deque = deque(maxlen=10000)
+        # Incremental win/loss tallies so get_trade_stats never rescans
+        # history (unresolved trades count in neither)
+        self._wins = 0
+        self._losses = 0
         self.pending_trades: Dict = {}
+        # (expire_at, trade_id) min-heap so resolution pops only trades
+        # that are actually due instead of scanning every pending one
+        self._expiry_heap: List[Tuple[float, str]] = []
+        # Set by _execute_trade so the executor loop sleeps with zero
+        # wakeups while nothing is pending
+        self._pending_event = asyncio.Event()
+        # Trade persistence is funnelled through this queue to a single
+        # background writer, so the trading path never waits on sqlite
+        self._db_queue: asyncio.Queue = asyncio.Queue()
         self.trades_this_hour = 0
-        self.min_confidence = 0.75 
+        self.min_confidence = 0.75
+        # Signals below this ATR are skipped before the agent runs: a
+        # dead market can't clear the payout spread anyway
+        self.min_atr = 0.00005
         self.loops: Dict[str, asyncio.Task] = {}
+        # call_later handles for the hourly tournament/learner timers
+        self._tournament_handle: Optional[asyncio.TimerHandle] = None
+        self._learner_handle: Optional[asyncio.TimerHandle] = None
+        # All subscriptions feed this queue; one consumer task drains it,
+        # so candle processing costs a single task however many
+        # asset/timeframe streams are live
+        self._candle_queue: asyncio.Queue = asyncio.Queue(maxsize=1024)
+        # Last analyzed bar per (asset, timeframe); feeds that emit
+        # intrabar updates only trigger analysis once per bar
+        self._last_analyzed: Dict[Tuple[str, int], int] = {}
+        # Analysis runs off the event loop; NumPy/Numba kernels release
+        # the GIL, so two workers let per-asset callbacks overlap
+        self._ta_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ta")
+        # Simulated outcomes come from one batched PCG64 draw per
+        # resolution pass; reproducible when the generator is seeded
+        self._rng = np.random.default_rng()
         
-    def start(self, loop: asyncio.AbstractEventLoop):
+    async def start(self):
         """Initializes and starts all background tasks."""
         if self.is_running:
             logger.warning("Bot is already running.")
@@ -54,18 +101,23 @@ class TradingBot:
 
         self.is_running = True
         logger.info("Starting Trading Bot...")
-        
+
+        # 0. Warm the Numba kernels on the TA pool so the first real
+        # candle doesn't pay the JIT compile cost
+        self._ta_pool.submit(self._warm_kernels)
+
         # 1. Start the main connection and data loops
-        self.loops['main'] = loop.create_task(self._main_loop())
-        
-        # 2. Start the automated tournament loop
-        self.loops['tournament'] = loop.create_task(self._tournament_loop())
-        
-        # 3. Start the trade execution loop
-        self.loops['executor'] = loop.create_task(self._trade_executor_loop())
-        
-        # 4. Start the learning loop
-        self.loops['learner'] = loop.create_task(self._knowledge_learner_loop())
+        self.loops['main'] = asyncio.create_task(self._main_loop())
+
+        # 2. Start the trade execution and DB writer loops
+        self.loops['executor'] = asyncio.create_task(self._trade_executor_loop())
+        self.loops['db_writer'] = asyncio.create_task(self._db_writer_loop())
+
+        # 3. Arm the periodic tournament/learner timers; call_later
+        # handles re-arm themselves without holding a task frame alive
+        # just to sleep (initial 30s wait covers connection setup)
+        self._schedule_tournament(30)
+        self._schedule_learner(3600)
 
     async def _main_loop(self):
         """Handles connection and market data subscription."""
@@ -75,51 +127,136 @@ class TradingBot:
             return
             
         logger.info("Starting market data feed...")
-        # Simulating candle data feed subscription
+        # One consumer drains every stream; subscriptions only enqueue.
+        # asyncio.create_task avoids the deprecated get_event_loop()
+        # thread-local lookup per spawn.
+        self.loops['consumer'] = asyncio.create_task(self._candle_consumer())
         for asset in self.client.assets:
-             self.loops[f'candles_{asset}'] = asyncio.get_event_loop().create_task(
-                 self.client.subscribe_candles(asset, self.current_timeframe, self._on_new_candle)
+             self.loops[f'candles_{asset}'] = asyncio.create_task(
+                 self.client.subscribe_candles(asset, self.current_timeframe, self._enqueue_candle)
              )
-        
+
         while self.is_running:
             # Re-subscribe/Connection health check
             await asyncio.sleep(5) 
 
+    async def _enqueue_candle(self, candle: Dict):
+        """Subscription callback: hand the candle to the consumer queue.
+
+        Non-blocking so a slow analysis pass never stalls the feed; under
+        sustained overload the oldest queued candle is dropped first.
+        """
+        try:
+            self._candle_queue.put_nowait(candle)
+        except asyncio.QueueFull:
+            self._candle_queue.get_nowait()
+            self._candle_queue.put_nowait(candle)
+            logger.warning("Candle queue full; dropped the oldest candle")
+
+    async def _candle_consumer(self):
+        """Single task draining the candle queue for every stream."""
+        while self.is_running:
+            candle = await self._candle_queue.get()
+            try:
+                await self._on_new_candle(candle)
+            except Exception as e:
+                logger.error(f"Candle processing error: {e}")
+
     async def _on_new_candle(self, candle: Dict):
         """Processes a new candle and generates a trade signal."""
         asset = candle["asset"]
         timeframe = candle["timeframe"]
-        
-        # 1. Update Market Data Store
+
+        # Dedupe to one analysis per closed bar: interim ticks for the
+        # same bar index are dropped before they cost anything
+        bar = candle.get("timestamp", 0) // timeframe if timeframe else 0
+        key = (asset, timeframe)
+        if self._last_analyzed.get(key) == bar:
+            return
+        self._last_analyzed[key] = bar
+
+        # 1. Update Market Data Store. The dict deque keeps the raw candles
+        # for serialization/signals; the SoA ring keeps OHLC as flat
+        # float64 arrays so analysis never re-reads dict fields. Both are
+        # O(1) per tick, newest first.
         if asset not in self.market_data:
-            self.market_data[asset] = {"candles": []}
-        
-        # Keep only the last 200 candles for analysis
-        self.market_data[asset]["candles"].insert(0, candle)
-        self.market_data[asset]["candles"] = self.market_data[asset]["candles"][:200]
-        
+            self.market_data[asset] = {"candles": deque(maxlen=200),
+                                       "ring": CandleRing(200)}
+
+        self.market_data[asset]["candles"].appendleft(candle)
+        self.market_data[asset]["ring"].push(candle)
+
         candles = self.market_data[asset]["candles"]
         if len(candles) < 20:
             return # Not enough data for analysis
 
-        # 2. Run Technical Analysis
-        self.patterns_detected = self.candlestick_analyzer.analyze_candles(candles)
-        self.indicator_values = self.indicators.calculate_all(candles)
-        self.levels_detected = self.level_analyzer.find_support_resistance(candles)
-        
+        # 2. Run Technical Analysis on the pool so the event loop keeps
+        # servicing socket I/O while the kernels crunch
+        arrays, patterns, indicators, levels, trend = (
+            await asyncio.get_running_loop().run_in_executor(
+                self._ta_pool, self._run_analysis, candles,
+                self.market_data[asset]["ring"])
+        )
+        self.market_data[asset]["arrays"] = arrays
+        self.patterns_detected = patterns
+        self.indicator_values = indicators
+        self.levels_detected = levels
+        self._analysis_cache[asset] = (
+            candle.get("timestamp"), patterns, indicators, levels, trend)
+
         # 3. Generate Trading Signal
         if self.is_trading:
+            # Cheap regime gate: reject flat markets from the fused
+            # indicator output before paying for the agent
+            atr = indicators.get("atr", {}).get("value", 0.0)
+            if atr < self.min_atr:
+                return
+            if self._knowledge_cache is None:
+                # Constant placeholder context, so the lookup is invariant
+                # between knowledge refreshes — no need to redo it per tick
+                self._knowledge_cache = self.knowledge_learner.get_relevant_knowledge("contextual data")
             signal = self.agent.generate_signal(
                 candles=candles,
                 patterns=self.patterns_detected,
                 indicators=self.indicator_values,
                 levels=self.levels_detected,
-                knowledge=self.knowledge_learner.get_relevant_knowledge("contextual data") # Placeholder context
+                knowledge=self._knowledge_cache
             )
             
             if signal.get("direction") not in ["HOLD", "neutral"] and signal.get("confidence", 0) >= self.min_confidence:
                 await self._execute_trade(asset, signal)
     
+    def _warm_kernels(self):
+        """Runs the full analysis once over dummy candles at startup.
+
+        Triggers JIT compilation of the swing/RSI/EMA kernels off the hot
+        path; without this the first live candle absorbs the compile time.
+        """
+        try:
+            base = 1.1
+            dummy = [{"open": base, "high": base + 0.001, "low": base - 0.001,
+                      "close": base + 0.0005 * (i % 3 - 1), "timestamp": i}
+                     for i in range(60)]
+            self._run_analysis(dummy)
+            logger.debug("Analysis kernels warmed.")
+        except Exception as e:
+            logger.warning(f"Kernel warm-up failed: {e}")
+
+    def _run_analysis(self, candles, ring: Optional[CandleRing] = None) -> Tuple:
+        """Synchronous analysis block, run on the TA thread pool.
+
+        Reads the shared SoA arrays from the per-asset ring (or rebuilds
+        them when no ring is given, e.g. warm-up) and feeds them to all
+        three analyzers; returns everything so the caller can publish
+        results from the event-loop thread.
+        """
+        arrays = ring.arrays() if ring is not None else candles_to_arrays(candles)
+        patterns = self.candlestick_analyzer.analyze_incremental(candles, arrays=arrays)
+        indicators = self.indicators.calculate_all(candles, arrays=arrays)
+        levels = self.level_analyzer.find_support_resistance(candles, arrays=arrays)
+        trend = self.candlestick_analyzer.get_trend(candles, closes=arrays[3])
+        return arrays, patterns, indicators, levels, trend
+
     async def _execute_trade(self, asset: str, signal: Dict):
         """Places a trade based on the validated signal."""
         direction = signal["direction"]
@@ -138,78 +275,158 @@ class TradingBot:
         trade_result = await self.client.place_trade(asset, trade_amount, direction, expiration)
         
         if trade_result and trade_result.get("trade_id"):
+            created_at = time.monotonic()
             self.pending_trades[trade_result["trade_id"]] = {
                 "asset": asset,
                 "amount": trade_amount,
                 "direction": direction,
-                "created_at": time.time(),
+                # Monotonic so trade ageing is immune to wall-clock jumps
+                "created_at": created_at,
                 "status": "pending"
             }
-            db.save_trade(asset, trade_amount, direction, expiration, trade_id=trade_result["trade_id"])
+            # Simulation resolves 5s after placement
+            heapq.heappush(self._expiry_heap, (created_at + 5, trade_result["trade_id"]))
+            self._pending_event.set()
+            # Hand the write to the background DB writer; no await needed
+            self._db_queue.put_nowait(partial(
+                db.save_trade, asset, trade_amount, direction, expiration,
+                trade_id=trade_result["trade_id"]
+            ))
             
     async def _resolve_trades(self):
         """Checks for expired trades and logs results."""
-        resolved_ids = []
-        for trade_id, trade in list(self.pending_trades.items()):
-            # Real implementation would poll the Pocket Option API
-            
-            # Simulation: Resolve trades after a random delay
-            if time.time() - trade["created_at"] > 5: 
-                outcome = random.choice(["win", "loss"])
-                profit = trade["amount"] * 0.85 if outcome == "win" else -trade["amount"]
-                
-                self.trade_history.append({**trade, "outcome": outcome, "profit": profit})
-                self.client.balance += profit # Update balance in simulation
-                db.update_trade_outcome(trade_id, outcome, profit)
-                resolved_ids.append(trade_id)
-                logger.info(f"TRADE RESOLVED: {trade['asset']} {trade['direction']} -> {outcome.upper()}. Profit: ${profit:.2f}")
+        # Pop only the trades whose expiry has passed; everything still
+        # pending stays untouched on the heap. The pops stay synchronous
+        # (awaits deferred below) so no insert can race the pass.
+        now = time.monotonic()
+        expired = []
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            _, trade_id = heapq.heappop(self._expiry_heap)
+            trade = self.pending_trades.get(trade_id)
+            if trade is not None:
+                expired.append((trade_id, trade))
+
+        if not expired:
+            return
 
-        for trade_id in resolved_ids:
+        # Real implementation would poll the Pocket Option API;
+        # simulation draws the whole pass's outcomes in one batch
+        wins = self._rng.random(len(expired)) < 0.5
+        resolved = []
+        for (trade_id, trade), won in zip(expired, wins):
+            outcome = "win" if won else "loss"
+            profit = trade["amount"] * 0.85 if won else -trade["amount"]
+
+            self.trade_history.append({**trade, "outcome": outcome, "profit": profit})
+            self._wins += outcome == "win"
+            self._losses += outcome == "loss"
+            self.client.balance += profit # Update balance in simulation
+            resolved.append((trade_id, outcome, profit))
+            logger.info(f"TRADE RESOLVED: {trade['asset']} {trade['direction']} -> {outcome.upper()}. Profit: ${profit:.2f}")
+
+        for trade_id, outcome, profit in resolved:
             del self.pending_trades[trade_id]
+            self._db_queue.put_nowait(partial(
+                db.update_trade_outcome, trade_id, outcome, profit))
             
-    async def _tournament_loop(self):
-        """Runs periodically to check and join the daily free tournament."""
-        await asyncio.sleep(30) # Initial wait for connection setup
-        while self.is_running:
-            try:
-                # The manager handles the internal 4-hour frequency check
-                await self.tournament_manager.join_daily_free_tournament() 
-                
-                # Check again in 1 hour
-                await asyncio.sleep(3600) 
-            except asyncio.CancelledError: 
-                raise
-            except Exception as e:
-                logger.error(f"Tournament loop error: {e}")
-                await asyncio.sleep(3600)
+    def _schedule_tournament(self, delay: float):
+        self._tournament_handle = asyncio.get_running_loop().call_later(
+            delay, lambda: asyncio.create_task(self._tournament_tick()))
+
+    async def _tournament_tick(self):
+        """Single tournament check; re-arms itself for the next hour."""
+        try:
+            # The manager handles the internal 4-hour frequency check
+            await self.tournament_manager.join_daily_free_tournament()
+        except Exception as e:
+            logger.error(f"Tournament loop error: {e}")
+        if self.is_running:
+            self._schedule_tournament(3600)
                 
     async def _trade_executor_loop(self):
         """Handles trade execution and pending trade resolution."""
         while self.is_running:
+            if not self._expiry_heap:
+                # Nothing pending: block until a trade is placed instead
+                # of polling on a timer
+                await self._pending_event.wait()
+                self._pending_event.clear()
+                continue
+            # Sleep until the earliest expiry. Trades placed meanwhile
+            # always expire later than the current head, so a plain
+            # sleep can't miss anything.
+            delay = self._expiry_heap[0][0] - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
             await self._resolve_trades()
-            await asyncio.sleep(5) # Check resolution every 5 seconds
 
-    async def _knowledge_learner_loop(self):
-        """Handles data learning and model training."""
-        while self.is_running:
-            # Placeholder for continuous learning/retraining logic
-            await asyncio.sleep(3600) 
+    async def _db_writer_loop(self):
+        """Drains queued trade writes in batches on one worker thread.
+
+        Collects up to 32 writes (or whatever arrives within 100ms) and
+        runs them in a single to_thread hop, amortizing the thread
+        handoff; anything still queued is flushed on shutdown.
+        """
+        batch = []
+        try:
+            while self.is_running:
+                try:
+                    batch.append(await asyncio.wait_for(self._db_queue.get(), timeout=0.1))
+                    while len(batch) < 32 and not self._db_queue.empty():
+                        batch.append(self._db_queue.get_nowait())
+                except asyncio.TimeoutError:
+                    pass
+                if batch:
+                    await asyncio.to_thread(self._flush_db_batch, batch)
+                    batch = []
+        finally:
+            while not self._db_queue.empty():
+                batch.append(self._db_queue.get_nowait())
+            if batch:
+                self._flush_db_batch(batch)
+
+    @staticmethod
+    def _flush_db_batch(batch: List):
+        for write in batch:
+            try:
+                write()
+            except Exception as e:
+                logger.error(f"DB write failed: {e}")
+
+    def _schedule_learner(self, delay: float):
+        self._learner_handle = asyncio.get_running_loop().call_later(
+            delay, lambda: asyncio.create_task(self._learner_tick()))
+
+    async def _learner_tick(self):
+        """Single learning pass; re-arms itself for the next hour."""
+        # Placeholder for continuous learning/retraining logic.
+        # Knowledge may have changed; force the next signal pass to
+        # re-query it
+        self._knowledge_cache = None
+        if self.is_running:
+            self._schedule_learner(3600)
             
-    def stop(self):
+    async def stop(self):
         """Stops all background tasks."""
         if not self.is_running:
             return
 
         self.is_running = False
         logger.info("Stopping Trading Bot...")
-        
+
         for name, task in self.loops.items():
             if not task.done():
                 task.cancel()
                 logger.info(f"Cancelled {name} loop.")
-        
+
         self.loops = {}
-        
+
+        for handle in (self._tournament_handle, self._learner_handle):
+            if handle is not None:
+                handle.cancel()
+        self._tournament_handle = None
+        self._learner_handle = None
+
     def set_min_confidence(self, confidence: float):
         self.min_confidence = max(0.5, min(0.95, confidence))
         logger.info(f"Minimum confidence set to: {self.min_confidence:.2%}")
@@ -234,133 +451,40 @@ class TradingBot:
         }
     
     def get_market_analysis(self) -> Dict:
-        candles = self.market_data.get(self.current_asset, {}).get("candles", [])
+        data = self.market_data.get(self.current_asset, {})
+        candles = data.get("candles", [])
+        cached = self._analysis_cache.get(self.current_asset)
+        if cached is not None and candles and cached[0] == candles[0].get("timestamp"):
+            # Cache hit: nothing new since the last tick's analysis
+            _, patterns, indicators, levels, trend = cached
+        else:
+            patterns = self.patterns_detected
+            indicators = self.indicator_values
+            levels = self.levels_detected
+            arrays = data.get("arrays")
+            trend = self.candlestick_analyzer.get_trend(
+                candles, closes=arrays[3] if arrays is not None else None)
         return {
-            "patterns": self.patterns_detected[:10],
-            "levels": self.levels_detected,
-            "indicators": self.indicator_values,
-            "trend": self.candlestick_analyzer.get_trend(candles),
-            "candles": candles # Send candles for charting
+            "patterns": patterns[:10],
+            "levels": levels,
+            "indicators": indicators,
+            "trend": trend,
+            # The chart only renders the recent window; 100 candles
+            # halves the serialized payload per poll
+            "candles": list(islice(candles, 100))
         }
     
     def get_trade_stats(self) -> Dict:
-        total_trades = len(self.trade_history)
-        total_wins = sum(1 for t in self.trade_history if t.get("outcome") == "win")
-        
+        resolved = self._wins + self._losses
+        n = len(self.trade_history)
         return {
-            "total_trades": total_trades,
-            "total_wins": total_wins,
-            "total_losses": total_trades - total_wins,
-            "recent_trades": self.trade_history[-10:],
-            "win_rate": total_wins / total_trades if total_trades > 0 else 0,
+            "total_trades": n,
+            "total_wins": self._wins,
+            "total_losses": self._losses,
+            "recent_trades": list(islice(self.trade_history, max(0, n - 10), n)),
+            "win_rate": self._wins / resolved if resolved > 0 else 0,
             "pending_trades": len(self.pending_trades)
-        }async def handle_candle(self, candle: Dict):
-        """Processes a new candle and runs the trading logic."""
-        asset = candle["asset"]
-        timeframe = candle["timeframe"]
-        
-        # 1. Store the candle in market data (Most recent candle at index 0)
-        if asset not in self.market_data:
-            self.market_data[asset] = {"candles": []}
-            
-        self.market_data[asset]["candles"].insert(0, candle)
-        self.market_data[asset]["candles"] = self.market_data[asset]["candles"][:200]
-        
-        # Only analyze the currently active asset/timeframe for web updates
-        if asset == self.current_asset and timeframe == self.current_timeframe:
-            candles_to_analyze = self.market_data[asset]["candles"]
-            
-            # 2. Run analysis modules
-            self.patterns_detected = self.candlestick_analyzer.analyze_candles(candles_to_analyze)
-            self.levels_detected = self.level_analyzer.find_support_resistance(candles_to_analyze)
-            self.indicator_values = self.indicators.calculate_all(candles_to_analyze)
-            
-            # 3. Generate Trade Decision
-            if self.is_trading and self.is_running:
-                context = {
-                    "asset": asset, "timeframe": timeframe, "patterns": self.patterns_detected,
-                    "levels": self.levels_detected, "indicators": self.indicator_values,
-                    "balance": self.client.balance
-                }
-                trade_suggestion = self.agent.get_trade_decision(context)
-                
-                direction = trade_suggestion.get("direction")
-                confidence = trade_suggestion.get("confidence", 0)
-                
-                logger.info(f"Agent Suggestion: {direction} with {confidence:.2%} confidence.")
-                
-                # 4. Execute Trade if confident enough
-                if direction in ("CALL", "PUT") and confidence >= self.min_confidence:
-                    amount = self.agent.get_trade_amount(self.client.balance, confidence)
-                    
-                    # NOTE: This line needs the TournamentScheduler imported at the top of trading_bot.py
-                    expiration = self.agent.determine_expiration(
-                        self.indicator_values.get("atr", 0.0), 
-                        self.candlestick_analyzer.get_pattern_strength(self.patterns_detected)
-                    )
-                    
-                    logger.success(f"PLACING TRADE: {direction} {asset} for ${amount:.2f} @ {confidence:.2%} confidence. Exp: {expiration}s")
-                    
-                    trade_result = await self.client.place_trade(
-                        asset=asset, 
-                        direction=direction, 
-                        amount=amount, 
-                        duration=expiration
-                    )
-                    self.trades_this_hour += 1
-                    self.trade_history.append({
-                        "asset": asset, "direction": direction, "amount": amount, 
-                        "confidence": confidence, "outcome": "PENDING"
-                    })
-                else:
-                    logger.debug(f"Signal confidence {confidence:.2%} too low (Min: {self.min_confidence:.2%}) or direction is HOLD.")
-
-    async def start(self):
-        """Main asynchronous loop for the bot."""
-        if self.is_running: return
-
-        self.is_running = True
-        logger.info("Bot is starting...")
-
-        if not await self.client.connect():
-            self.is_running = False
-            logger.error("Failed to connect to Pocket Option Client. Stopping.")
-            return
-
-        logger.info(f"Connected. Running in {'DEMO' if self.client.is_simulation() else 'REAL'} mode. Balance: ${self.client.balance:.2f}")
-
-        # Subscribe to market data for all available timeframes
-        for tf in self.available_timeframes:
-            await self.client.subscribe_candles(
-                asset=self.current_asset, 
-                timeframe=tf, 
-                callback=self.handle_candle
-            )
-            logger.info(f"Subscribed to {self.current_asset} at {tf}s timeframe.")
-            
-        # Start tournament scheduler (optional)
-        # NOTE: You need a basic TournamentScheduler class defined in your project
-        # TournamentScheduler(self.tournament_manager).start_scheduler()
-
-        # Keep the async thread alive and processing tasks
-        while self.is_running:
-            await asyncio.sleep(5) 
-
-        logger.info("Bot main loop exited.")
-
-    async def stop(self):
-        """Stops the main bot loop and disconnects."""
-        if not self.is_running: return
-
-        self.is_running = False
-        logger.info("Bot is stopping...")
-
-        # Unsubscribe from all assets/timeframes
-        for tf in self.available_timeframes:
-            await self.client.unsubscribe_candles(asset=self.current_asset, timeframe=tf)
-        
-        await self.client.disconnect() 
-        logger.info("Bot stopped and disconnected.")
+        }
 
     # Utility methods for the web interface
     def start_trading(self):
@@ -387,5 +511,7 @@ class TradingBot:
             logger.error(f"Invalid timeframe value: {timeframe}")
 
     def get_recent_trades(self, limit: int = 50) -> List[Dict]:
-        # Simple history retrieval for the web UI
-        return self.trade_history[-limit:][::-1]
+        # Simple history retrieval for the web UI (newest first); islice
+        # walks only the tail instead of slicing the whole history
+        n = len(self.trade_history)
+        return list(islice(self.trade_history, max(0, n - limit), n))[::-1]